@@ -6,12 +6,13 @@ Backtests a portfolio of stocks over historical data and compares
 against S&P 500 (SPY). Supports CLI usage and module import.
 
 Dependencies:
-    pip install yfinance tabulate numpy
+    pip install yfinance numpy pandas
 
 Usage:
     python backtest.py --tickers TEAM,INTU,DOCU --weights 0.4,0.3,0.3 --period 2y
     python backtest.py --tickers TEAM,INTU,DOCU --period 6m
     python backtest.py --tickers ANET,FCX,XOM --start 2024-01-01 --end 2026-02-20
+    python backtest.py --tickers ANET,FCX --period 1y --no-cache   # skip the price cache
 
 Import:
     from backtest import backtest
@@ -20,13 +21,21 @@ Import:
 
 import argparse
 import datetime
+import functools
+import hashlib
+import json
 import math
+import os
+import pickle
+import re
 import sys
+import tempfile
+import time
 import warnings
 
 import numpy as np
+import pandas as pd
 import yfinance as yf
-from tabulate import tabulate
 
 warnings.filterwarnings("ignore")
 
@@ -49,11 +58,67 @@ BENCHMARK = "SPY"
 RISK_FREE_RATE = 0.045  # ~4.5% annualized (current T-bill)
 TRADING_DAYS = 252
 
+# Minimum column widths for the CLI tables (visible characters, ANSI
+# excluded); a column grows to fit its widest cell
+SCORECARD_WIDTHS = (18, 11, 9, 40)
+TICKER_WIDTHS = (8, 8, 14, 12, 14)
+MONTHLY_WIDTHS = (6,) + (5,) * 12 + (6,)  # header + 2, as tabulate pads
+
+ANSI_RE = re.compile(r"\033\[[0-9;]*m")
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "prices")
+CACHE_TTL = 24 * 60 * 60  # seconds; ranges that ended in the past never expire
+
 
 # ---------------------------------------------------------------------------
 # Data fetching
 # ---------------------------------------------------------------------------
 
+def cache_prices(fetch):
+    """Cache a price fetcher on disk, keyed by (tickers, period, start, end).
+    Lookback periods and ranges ending today are refetched after CACHE_TTL.
+    Only complete downloads (a valid close for every ticker and the
+    benchmark) are written; use_cache=False bypasses the cache entirely."""
+    @functools.wraps(fetch)
+    def wrapper(tickers, period=None, start=None, end=None, use_cache=True):
+        # fetch only uses start/end when both are set, otherwise a rolling
+        # period; key and expiry on what is actually downloaded
+        if start and end:
+            key = json.dumps([sorted(tickers), None, start, end])
+        else:
+            key = json.dumps([sorted(tickers), period or "2y", None, None])
+        path = os.path.join(CACHE_DIR, hashlib.md5(key.encode()).hexdigest() + ".pkl")
+
+        if use_cache and os.path.exists(path):
+            historical = bool(start and end) and end < datetime.date.today().isoformat()
+            if historical or time.time() - os.path.getmtime(path) < CACHE_TTL:
+                try:
+                    return pd.read_pickle(path)
+                except (OSError, EOFError, pickle.UnpicklingError):
+                    pass  # unreadable entry: refetch and overwrite it
+
+        prices = fetch(tickers, period=period, start=start, end=end)
+        wanted = list(tickers) + [BENCHMARK]
+        complete = (not prices.empty and all(t in prices.columns for t in wanted)
+                    and bool(prices[wanted].notna().any().all()))
+        if use_cache and complete:
+            # Write to a temp file and rename, so an interrupted or concurrent
+            # run never leaves a truncated entry behind
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+            os.close(fd)
+            try:
+                prices.to_pickle(tmp)
+                os.replace(tmp, path)
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+        return prices
+
+    return wrapper
+
+
+@cache_prices
 def fetch_prices(tickers, period=None, start=None, end=None):
     """Download adjusted close prices for tickers + benchmark.
     Returns a DataFrame with tickers as columns and dates as index."""
@@ -69,42 +134,79 @@ def fetch_prices(tickers, period=None, start=None, end=None):
     raw = yf.download(all_tickers, **kwargs)
 
     # Extract Close prices
-    if isinstance(raw.columns, __import__("pandas").MultiIndex):
+    if isinstance(raw.columns, pd.MultiIndex):
         prices = raw["Close"]
     else:
         prices = raw[["Close"]].copy()
         prices.columns = all_tickers
 
-    prices = prices.dropna(how="all").ffill()
-    return prices
+    # Forward-fill gaps and drop all-NaN rows in one pass over the array:
+    # each cell takes the value from the latest row where its column is valid
+    arr = prices.to_numpy(dtype=np.float64)
+    valid = ~np.isnan(arr)
+    last_valid = np.where(valid, np.arange(len(arr))[:, None], 0)
+    np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+    filled = arr[last_valid, np.arange(arr.shape[1])]
+
+    keep = valid.any(axis=1)
+    return pd.DataFrame(filled[keep], index=prices.index[keep], columns=prices.columns)
 
 
 # ---------------------------------------------------------------------------
 # Portfolio simulation
 # ---------------------------------------------------------------------------
 
+def compound(returns):
+    """Growth of $1 from daily returns, via exp(cumsum(log1p(r)))."""
+    return np.exp(np.log1p(returns).cumsum())
+
+
 def simulate_portfolio(prices, tickers, weights):
     """Compute daily portfolio and benchmark returns.
     Returns dict with portfolio_returns, benchmark_returns, cumulative series."""
-    # Daily returns for each ticker
-    returns = prices[tickers].pct_change().dropna()
-    bench_returns = prices[BENCHMARK].pct_change().dropna()
-
-    # Align dates
-    common = returns.index.intersection(bench_returns.index)
-    returns = returns.loc[common]
-    bench_returns = bench_returns.loc[common]
-
-    # Weighted portfolio return
-    w = np.array(weights)
-    portfolio_daily = (returns * w).sum(axis=1)
+    # Daily returns for each ticker and the benchmark, computed on the raw
+    # price matrix; keep only dates where every column has a return
+    arr = prices[list(tickers) + [BENCHMARK]].to_numpy(dtype=np.float64)
+    rets = arr[1:] / arr[:-1] - 1
+    complete = ~np.isnan(rets).any(axis=1)
+    rets = rets[complete]
+    common = prices.index[1:][complete]
+
+    returns = pd.DataFrame(rets[:, :-1], index=common, columns=list(tickers))
+    bench_returns = pd.Series(rets[:, -1], index=common, name=BENCHMARK)
+
+    # Weighted portfolio return (single matrix-vector product; a lone ticker
+    # is just a scaled column)
+    w = np.asarray(weights, dtype=np.float64)
+    returns_arr = np.ascontiguousarray(rets[:, :-1])
+    if returns_arr.shape[1] == 1:
+        daily = returns_arr[:, 0] * w[0]
+    else:
+        daily = returns_arr @ w
+    portfolio_daily = pd.Series(daily, index=returns.index)
 
     # Cumulative returns (growth of $1)
-    portfolio_cum = (1 + portfolio_daily).cumprod()
-    benchmark_cum = (1 + bench_returns).cumprod()
+    portfolio_cum = compound(portfolio_daily)
+    benchmark_cum = compound(bench_returns)
 
     # Per-ticker cumulative
-    ticker_cum = (1 + returns).cumprod()
+    ticker_cum = compound(returns)
+
+    # Period returns, shared by the win rate and the monthly table. Dates are
+    # sorted, so each month starts where its datetime64[M] label changes and
+    # np.add.reduceat sums the log returns per run; years roll up the same way
+    # from the monthly sums.
+    log_returns = np.log1p(portfolio_daily)
+    months = returns.index.values.astype("datetime64[M]")
+    month_starts = np.flatnonzero(np.r_[True, months[1:] != months[:-1]])
+    monthly_log = np.add.reduceat(log_returns.to_numpy(), month_starts)
+    month_labels = months[month_starts]
+    monthly = pd.Series(np.expm1(monthly_log), index=pd.PeriodIndex(month_labels, freq="M"))
+
+    years = month_labels.astype("datetime64[Y]")
+    year_starts = np.flatnonzero(np.r_[True, years[1:] != years[:-1]])
+    yearly = pd.Series(np.expm1(np.add.reduceat(monthly_log, year_starts)),
+                       index=years[year_starts].astype(int) + 1970)
 
     return {
         "portfolio_daily": portfolio_daily,
@@ -113,6 +215,9 @@ def simulate_portfolio(prices, tickers, weights):
         "benchmark_cum": benchmark_cum,
         "ticker_cum": ticker_cum,
         "ticker_daily": returns,
+        "log_returns": log_returns,
+        "monthly": monthly,
+        "yearly": yearly,
         "dates": common,
     }
 
@@ -121,6 +226,12 @@ def simulate_portfolio(prices, tickers, weights):
 # Metrics
 # ---------------------------------------------------------------------------
 
+def compute_drawdown(cum):
+    """Drawdown of a cumulative growth array from its running peak."""
+    running_max = np.maximum.accumulate(cum)
+    return (cum - running_max) / running_max
+
+
 def compute_metrics(sim):
     """Compute all performance metrics from simulation results."""
     p = sim["portfolio_daily"]
@@ -128,55 +239,63 @@ def compute_metrics(sim):
     n_days = len(p)
     n_years = n_days / TRADING_DAYS
 
+    # Work on the raw arrays; pandas is only needed for date-labelled output
+    dates = p.index
+    p_arr = p.to_numpy()
+    b_arr = b.to_numpy()
+    cum_arr = sim["portfolio_cum"].to_numpy()
+    bench_cum_arr = sim["benchmark_cum"].to_numpy()
+
     # Total return
-    total_return = float(sim["portfolio_cum"].iloc[-1]) - 1
-    bench_total = float(sim["benchmark_cum"].iloc[-1]) - 1
+    total_return = float(cum_arr[-1]) - 1
+    bench_total = float(bench_cum_arr[-1]) - 1
 
     # Annualized return
     ann_return = (1 + total_return) ** (1 / n_years) - 1 if n_years > 0 else 0
     bench_ann = (1 + bench_total) ** (1 / n_years) - 1 if n_years > 0 else 0
 
     # Volatility (annualized)
-    volatility = float(p.std()) * math.sqrt(TRADING_DAYS)
-    bench_vol = float(b.std()) * math.sqrt(TRADING_DAYS)
+    volatility = float(p_arr.std(ddof=1)) * math.sqrt(TRADING_DAYS)
+    bench_vol = float(b_arr.std(ddof=1)) * math.sqrt(TRADING_DAYS)
 
     # Sharpe ratio
     sharpe = (ann_return - RISK_FREE_RATE) / volatility if volatility > 0 else 0
 
     # Sortino ratio (downside deviation)
-    downside = p[p < 0]
-    downside_std = float(downside.std()) * math.sqrt(TRADING_DAYS) if len(downside) > 0 else 0
+    downside = p_arr[p_arr < 0]
+    downside_std = float(downside.std(ddof=1)) * math.sqrt(TRADING_DAYS) if downside.size > 0 else 0
     sortino = (ann_return - RISK_FREE_RATE) / downside_std if downside_std > 0 else 0
 
     # Max drawdown
-    cum = sim["portfolio_cum"]
-    running_max = cum.cummax()
-    drawdown = (cum - running_max) / running_max
-    max_dd = float(drawdown.min())
-    dd_end_idx = drawdown.idxmin()
-    dd_start_idx = cum.loc[:dd_end_idx].idxmax()
-
-    bench_cum = sim["benchmark_cum"]
-    bench_running_max = bench_cum.cummax()
-    bench_dd = (bench_cum - bench_running_max) / bench_running_max
-    bench_max_dd = float(bench_dd.min())
-
-    # Monthly returns for win rate
-    monthly = p.resample("ME").apply(lambda x: (1 + x).prod() - 1)
-    win_rate = float((monthly > 0).sum()) / len(monthly) if len(monthly) > 0 else 0
-
-    # Beta
-    cov = np.cov(p.values, b.values)
-    beta = cov[0, 1] / cov[1, 1] if cov[1, 1] != 0 else 0
+    dd_arr = compute_drawdown(cum_arr)
+    drawdown = pd.Series(dd_arr, index=dates)
+    dd_end_i = int(dd_arr.argmin())
+    max_dd = float(dd_arr[dd_end_i])
+    dd_end_idx = dates[dd_end_i]
+    dd_start_idx = dates[int(cum_arr[:dd_end_i + 1].argmax())]
+
+    bench_max_dd = float(compute_drawdown(bench_cum_arr).min())
+
+    # Monthly win rate
+    monthly = sim["monthly"]
+    monthly_arr = monthly.to_numpy()
+    win_rate = np.count_nonzero(monthly_arr > 0) / monthly_arr.size if monthly_arr.size > 0 else 0
+
+    # Beta from co-moment sums (no 2x2 np.cov matrix)
+    sum_p, sum_b = p_arr.sum(), b_arr.sum()
+    var_b = n_days * (b_arr @ b_arr) - sum_b * sum_b
+    beta = (n_days * (p_arr @ b_arr) - sum_p * sum_b) / var_b if var_b != 0 else 0
 
     # Alpha (Jensen's)
     alpha = ann_return - (RISK_FREE_RATE + beta * (bench_ann - RISK_FREE_RATE))
 
     # Best/worst day
-    best_day = float(p.max())
-    worst_day = float(p.min())
-    best_day_date = p.idxmax()
-    worst_day_date = p.idxmin()
+    best_i = int(p_arr.argmax())
+    worst_i = int(p_arr.argmin())
+    best_day = float(p_arr[best_i])
+    worst_day = float(p_arr[worst_i])
+    best_day_date = dates[best_i]
+    worst_day_date = dates[worst_i]
 
     return {
         "total_return": total_return,
@@ -207,34 +326,33 @@ def compute_metrics(sim):
 
 def compute_monthly_table(sim):
     """Build a year x month returns table."""
-    p = sim["portfolio_daily"]
-    monthly = p.resample("ME").apply(lambda x: (1 + x).prod() - 1)
-
-    rows = {}
-    for date, ret in monthly.items():
-        year = date.year
-        month = date.month
-        if year not in rows:
-            rows[year] = [None] * 12
-        rows[year][month - 1] = ret
+    monthly = sim["monthly"]
+    yearly = sim["yearly"]
 
-    # Yearly total
-    yearly = p.resample("YE").apply(lambda x: (1 + x).prod() - 1)
-    for date, ret in yearly.items():
-        year = date.year
-        if year in rows:
-            rows[year].append(ret)
+    # Pivot to one row per year, one column per month, plus the yearly total
+    table = pd.DataFrame({
+        "r": monthly.to_numpy(),
+        "y": monthly.index.year,
+        "m": monthly.index.month,
+    }).pivot(index="y", columns="m", values="r").reindex(columns=range(1, 13))
+    table[13] = yearly
 
-    return rows
+    return {
+        int(year): [None if np.isnan(v) else v for v in values]
+        for year, values in zip(table.index, table.to_numpy())
+    }
 
 
 def compute_per_ticker_metrics(sim, tickers, weights):
     """Return per-ticker performance breakdown."""
+    # One array per frame; each ticker is then a plain column index
+    totals = sim["ticker_cum"][list(tickers)].to_numpy()[-1] - 1
+    vols = sim["ticker_daily"][list(tickers)].to_numpy().std(axis=0, ddof=1)
+
     results = []
     for i, ticker in enumerate(tickers):
-        daily = sim["ticker_daily"][ticker]
-        total = float(sim["ticker_cum"][ticker].iloc[-1]) - 1
-        vol = float(daily.std()) * math.sqrt(TRADING_DAYS)
+        total = float(totals[i])
+        vol = float(vols[i]) * math.sqrt(TRADING_DAYS)
         results.append({
             "ticker": ticker,
             "weight": weights[i],
@@ -272,6 +390,25 @@ def colour_ratio(val, good_threshold=1.0):
         return f"{RED}{s}{RESET}"
 
 
+def fmt_row(cols, widths, aligns):
+    """Pad each cell to its column width by visible length, two spaces apart."""
+    cells = []
+    for text, width, align in zip(cols, widths, aligns):
+        pad = " " * (width - len(ANSI_RE.sub("", text)))
+        cells.append(pad + text if align == "right" else text + pad)
+    return "  ".join(cells).rstrip()
+
+
+def print_table(rows, headers, widths, aligns):
+    """Print a simple-style table: header, dashed rule, then rows."""
+    widths = [max([w] + [len(ANSI_RE.sub("", row[i])) for row in [headers] + rows])
+              for i, w in enumerate(widths)]
+    print(fmt_row(headers, widths, aligns))
+    print(fmt_row(["-" * w for w in widths], widths, aligns))
+    for row in rows:
+        print(fmt_row(row, widths, aligns))
+
+
 def print_header(title):
     print()
     print(f"{BOLD}{CYAN}{'=' * 72}{RESET}")
@@ -312,10 +449,10 @@ def print_scorecard(metrics):
          f"{metrics['n_days']}", f"~{metrics['n_years']:.1f} years"],
     ]
 
-    print(tabulate(rows,
-                   headers=["Metric", "Portfolio", "S&P 500", "Note"],
-                   tablefmt="simple",
-                   colalign=("left", "right", "right", "left")))
+    print_table(rows,
+                headers=["Metric", "Portfolio", "S&P 500", "Note"],
+                widths=SCORECARD_WIDTHS,
+                aligns=("left", "right", "right", "left"))
     print()
 
     # Best/worst days
@@ -340,10 +477,10 @@ def print_ticker_breakdown(ticker_metrics):
             colour_pct(t["contribution"]),
         ])
 
-    print(tabulate(rows,
-                   headers=["Ticker", "Weight", "Total Return", "Volatility", "Contribution"],
-                   tablefmt="simple",
-                   colalign=("left", "right", "right", "right", "right")))
+    print_table(rows,
+                headers=["Ticker", "Weight", "Total Return", "Volatility", "Contribution"],
+                widths=TICKER_WIDTHS,
+                aligns=("left", "right", "right", "right", "right"))
     print()
 
 
@@ -379,11 +516,45 @@ def print_monthly_table(monthly_data):
                 row.append(f"{DIM}—{RESET}")
         rows.append(row)
 
-    print(tabulate(rows, headers=["Year"] + months, tablefmt="simple",
-                   colalign=tuple(["left"] + ["right"] * 13)))
+    print_table(rows, headers=["Year"] + months, widths=MONTHLY_WIDTHS,
+                aligns=("left",) + ("right",) * 13)
     print()
 
 
+def sample_weekly(data, how, width):
+    """Resample a Series/DataFrame to weekly with `how` ("min", "last") and
+    thin it evenly to at most `width` columns."""
+    weekly = data.resample("W").agg(how)
+    if len(weekly) > width:
+        indices = np.linspace(0, len(weekly) - 1, width, dtype=int)
+        weekly = weekly.iloc[indices]
+    return weekly
+
+
+def build_grid(series_vals, y_min, y_range, height, glyphs):
+    """Scatter one glyph per column for each row of `series_vals` (k x W)
+    onto a height x W character grid. Earlier series win shared cells."""
+    n_cols = series_vals.shape[1]
+    rows = ((series_vals - y_min) / y_range * (height - 1)).astype(int)
+    rows = np.clip(rows, 0, height - 1)
+
+    grid = np.full((height, n_cols), " ", dtype=object)
+    cols = np.arange(n_cols)
+    for r, glyph in zip(rows[::-1], glyphs[::-1]):
+        grid[height - 1 - r, cols] = glyph
+    return grid
+
+
+def print_x_axis(index):
+    """Print a chart's bottom border with first/last month labels."""
+    print(f"  {'':>7} └{'─' * len(index)}┘")
+
+    start_date = index[0].strftime("%Y-%m")
+    end_date = index[-1].strftime("%Y-%m")
+    padding = max(len(index) - len(start_date) - len(end_date), 1)
+    print(f"  {'':>8} {DIM}{start_date}{' ' * padding}{end_date}{RESET}")
+
+
 def print_drawdown_chart(dd_series, width=68):
     """Print an ASCII drawdown chart."""
     print_section("DRAWDOWN CHART")
@@ -393,44 +564,26 @@ def print_drawdown_chart(dd_series, width=68):
         return
 
     # Resample to weekly for readability
-    weekly_dd = dd_series.resample("W").min()
-    if len(weekly_dd) > width:
-        # Sample evenly
-        indices = np.linspace(0, len(weekly_dd) - 1, width, dtype=int)
-        weekly_dd = weekly_dd.iloc[indices]
+    weekly_dd = sample_weekly(dd_series, "min", width)
 
     max_dd = abs(float(weekly_dd.min()))
     if max_dd == 0:
         max_dd = 0.01  # avoid division by zero
 
     height = 10
-    chart_rows = []
-
-    for row in range(height):
-        threshold = -max_dd * (1 - row / height)
-        line = ""
-        for val in weekly_dd.values:
-            if val <= threshold:
-                line += f"{RED}█{RESET}"
-            else:
-                line += " "
-        chart_rows.append(line)
+
+    # Row i is filled wherever the drawdown reaches that row's threshold;
+    # colour is applied once per row rather than per cell
+    thresholds = -max_dd * (1 - np.arange(height) / height)
+    mask = weekly_dd.to_numpy()[None, :] <= thresholds[:, None]
+    cells = np.where(mask, "█", " ")
 
     # Print with y-axis labels
-    for i, row_str in enumerate(chart_rows):
-        pct = -max_dd * (1 - i / height)
+    for pct, row in zip(thresholds, cells):
         label = f"{pct:>7.1%}"
-        print(f"  {DIM}{label}{RESET} │{row_str}│")
-
-    # X-axis
-    print(f"  {'':>7} └{'─' * len(weekly_dd)}┘")
+        print(f"  {DIM}{label}{RESET} │{RED}{''.join(row)}{RESET}│")
 
-    start_date = weekly_dd.index[0].strftime("%Y-%m")
-    end_date = weekly_dd.index[-1].strftime("%Y-%m")
-    padding = len(weekly_dd) - len(start_date) - len(end_date)
-    if padding < 1:
-        padding = 1
-    print(f"  {'':>8} {DIM}{start_date}{' ' * padding}{end_date}{RESET}")
+    print_x_axis(weekly_dd.index)
     print()
 
 
@@ -438,52 +591,28 @@ def print_equity_curve(portfolio_cum, benchmark_cum, width=68):
     """Print ASCII equity curve (growth of $1)."""
     print_section("EQUITY CURVE (Growth of $1)")
 
-    # Resample to weekly
-    p_weekly = portfolio_cum.resample("W").last()
-    b_weekly = benchmark_cum.resample("W").last()
+    # Resample both curves to weekly in one pass
+    weekly = sample_weekly(pd.concat([portfolio_cum, benchmark_cum], axis=1), "last", width)
+    vals = weekly.to_numpy().T
 
-    if len(p_weekly) > width:
-        indices = np.linspace(0, len(p_weekly) - 1, width, dtype=int)
-        p_weekly = p_weekly.iloc[indices]
-        b_weekly = b_weekly.iloc[indices]
-
-    all_vals = list(p_weekly.values) + list(b_weekly.values)
-    y_min = min(all_vals)
-    y_max = max(all_vals)
+    y_min = vals.min()
+    y_max = vals.max()
     y_range = y_max - y_min
     if y_range == 0:
         y_range = 0.01
 
     height = 12
 
-    # Build character grid
-    grid = [[" " for _ in range(len(p_weekly))] for _ in range(height)]
-
-    for col in range(len(p_weekly)):
-        # Portfolio point
-        p_row = int((p_weekly.values[col] - y_min) / y_range * (height - 1))
-        p_row = min(max(p_row, 0), height - 1)
-        grid[height - 1 - p_row][col] = f"{GREEN}●{RESET}"
-
-        # Benchmark point
-        b_row = int((b_weekly.values[col] - y_min) / y_range * (height - 1))
-        b_row = min(max(b_row, 0), height - 1)
-        if grid[height - 1 - b_row][col] == " ":
-            grid[height - 1 - b_row][col] = f"{YELLOW}·{RESET}"
+    # Portfolio first so it wins when both land on the same cell
+    grid = build_grid(vals, y_min, y_range, height,
+                      [f"{GREEN}●{RESET}", f"{YELLOW}·{RESET}"])
 
     for i, row in enumerate(grid):
         y_val = y_max - (i / (height - 1)) * y_range
         label = f"${y_val:.2f}"
         print(f"  {DIM}{label:>7}{RESET} │{''.join(row)}│")
 
-    print(f"  {'':>7} └{'─' * len(p_weekly)}┘")
-
-    start_date = p_weekly.index[0].strftime("%Y-%m")
-    end_date = p_weekly.index[-1].strftime("%Y-%m")
-    padding = len(p_weekly) - len(start_date) - len(end_date)
-    if padding < 1:
-        padding = 1
-    print(f"  {'':>8} {DIM}{start_date}{' ' * padding}{end_date}{RESET}")
+    print_x_axis(weekly.index)
     print(f"  {'':>8} {GREEN}● Portfolio{RESET}  {YELLOW}· S&P 500 (SPY){RESET}")
     print()
 
@@ -492,7 +621,8 @@ def print_equity_curve(portfolio_cum, benchmark_cum, width=68):
 # Main backtest function (importable)
 # ---------------------------------------------------------------------------
 
-def backtest(tickers, weights=None, period="2y", start=None, end=None, silent=False):
+def backtest(tickers, weights=None, period="2y", start=None, end=None, silent=False,
+             use_cache=True):
     """Run a full backtest and return results dict.
 
     Args:
@@ -501,6 +631,7 @@ def backtest(tickers, weights=None, period="2y", start=None, end=None, silent=Fa
         period: yfinance period string ("6m", "1y", "2y", "5y")
         start/end: Date strings "YYYY-MM-DD" (overrides period)
         silent: If True, don't print anything
+        use_cache: If False, ignore and don't write the on-disk price cache
 
     Returns:
         Dict with metrics, simulation data, and per-ticker breakdown.
@@ -526,7 +657,7 @@ def backtest(tickers, weights=None, period="2y", start=None, end=None, silent=Fa
     # Fetch data
     if not silent:
         print(f"  Fetching historical data...", end="", flush=True)
-    prices = fetch_prices(tickers, period=period, start=start, end=end)
+    prices = fetch_prices(tickers, period=period, start=start, end=end, use_cache=use_cache)
     if not silent:
         print(f" done. ({len(prices)} trading days)")
         print()
@@ -601,6 +732,7 @@ def main():
   python backtest.py --tickers TEAM,INTU,DOCU --weights 0.4,0.3,0.3 --period 2y
   python backtest.py --tickers ANET,FCX,XOM --period 1y
   python backtest.py --tickers TEAM,DOCU --start 2024-06-01 --end 2026-02-20
+  python backtest.py --tickers ANET,FCX --period 1y --no-cache
 """)
     parser.add_argument("--tickers", "-t", required=True,
                         help="Comma-separated ticker symbols")
@@ -612,6 +744,8 @@ def main():
                         help="Start date YYYY-MM-DD (overrides --period)")
     parser.add_argument("--end", "-e", default=None,
                         help="End date YYYY-MM-DD (overrides --period)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore cached price downloads and refetch")
 
     args = parser.parse_args()
 
@@ -629,7 +763,8 @@ def main():
     end = args.end if args.end else None
     period = args.period if not start else None
 
-    result = backtest(tickers, weights=weights, period=period, start=start, end=end)
+    result = backtest(tickers, weights=weights, period=period, start=start, end=end,
+                      use_cache=not args.no_cache)
     if result is None:
         sys.exit(1)
 
@@ -12,14 +12,21 @@ Dependencies:
 Usage:
     python oversold_screener.py                  # default watchlist
     python oversold_screener.py ANET INOD MOD    # custom tickers
+    python oversold_screener.py --no-cache       # ignore cached downloads
 """
 
+import os
 import sys
 import time
+import pickle
+import hashlib
+import tempfile
 import datetime
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import numpy as np
+import pandas as pd
 import yfinance as yf
 from tabulate import tabulate
 
@@ -57,47 +64,103 @@ def colour_pct(val, invert=False):
 # Technical indicator calculations
 # ---------------------------------------------------------------------------
 
+DTYPE = np.float32  # indicators only feed 1-decimal scores and thresholds
+
+
+def wrap_like(values, prices):
+    """Rewrap an indicator array in the Series/DataFrame shape of `prices`."""
+    if isinstance(prices, pd.DataFrame):
+        return pd.DataFrame(values, index=prices.index, columns=prices.columns)
+    return pd.Series(values, index=prices.index)
+
+
 def compute_rsi(prices, period=14):
-    delta = prices.diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
-    avg_gain = gain.ewm(alpha=1 / period, min_periods=period).mean()
-    avg_loss = loss.ewm(alpha=1 / period, min_periods=period).mean()
-    rs = avg_gain / avg_loss
-    return 100 - (100 / (1 + rs))
+    """Wilder's RSI: seed the average gain/loss with the simple mean of the
+    first `period` changes, then smooth recursively with alpha = 1/period.
+
+    Accepts a Series or a (dates x tickers) DataFrame; each column is walked
+    in one pass and NaN prices are skipped, so a column gives the same result
+    as its own dropna'd series."""
+    arr = prices.to_numpy(dtype=DTYPE)
+    out = np.full(arr.shape, np.nan, dtype=DTYPE)
+    prev = np.full(arr.shape[1:], np.nan, dtype=DTYPE)
+    count = np.zeros(arr.shape[1:], dtype=int)
+    avg_gain = np.zeros(arr.shape[1:], dtype=DTYPE)
+    avg_loss = np.zeros(arr.shape[1:], dtype=DTYPE)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for t, x in enumerate(arr):
+            valid = ~np.isnan(x)
+            step = valid & ~np.isnan(prev)
+            delta = np.where(step, x - prev, 0.0)
+            gain = np.maximum(delta, 0.0)
+            loss = np.maximum(-delta, 0.0)
+            count = count + step
+
+            # Sum the first `period` changes, then switch to Wilder smoothing
+            seeding = step & (count <= period)
+            smoothing = step & (count > period)
+            avg_gain = np.where(seeding, avg_gain + gain, avg_gain)
+            avg_loss = np.where(seeding, avg_loss + loss, avg_loss)
+            avg_gain = np.where(smoothing, (avg_gain * (period - 1) + gain) / period, avg_gain)
+            avg_loss = np.where(smoothing, (avg_loss * (period - 1) + loss) / period, avg_loss)
+            seeded = step & (count == period)
+            avg_gain = np.where(seeded, avg_gain / period, avg_gain)
+            avg_loss = np.where(seeded, avg_loss / period, avg_loss)
+
+            out[t] = np.where(valid & (count >= period),
+                              100 - (100 / (1 + avg_gain / avg_loss)), np.nan)
+            prev = np.where(valid, x, prev)
+
+    return wrap_like(out, prices)
+
+
+def ema(values, span):
+    """EMA seeded with the first valid value (pandas' ewm(adjust=False)),
+    applied down each column. NaN rows are skipped and stay NaN."""
+    alpha = 2 / (span + 1)
+    out = np.empty(values.shape, dtype=values.dtype)
+    e = np.full(values.shape[1:], np.nan, dtype=values.dtype)
+    for t, x in enumerate(values):
+        valid = ~np.isnan(x)
+        e = np.where(valid, np.where(np.isnan(e), x, alpha * x + (1 - alpha) * e), e)
+        out[t] = np.where(valid, e, np.nan)
+    return out
 
 
 def compute_macd(prices, fast=12, slow=26, signal=9):
-    ema_fast = prices.ewm(span=fast, adjust=False).mean()
-    ema_slow = prices.ewm(span=slow, adjust=False).mean()
-    macd_line = ema_fast - ema_slow
-    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+    """MACD line, signal line and histogram for a Series or a
+    (dates x tickers) DataFrame."""
+    arr = prices.to_numpy(dtype=DTYPE)
+    macd_line = ema(arr, fast) - ema(arr, slow)
+    signal_line = ema(macd_line, signal)
     histogram = macd_line - signal_line
-    return macd_line, signal_line, histogram
+    return (wrap_like(macd_line, prices), wrap_like(signal_line, prices),
+            wrap_like(histogram, prices))
 
 
 def detect_bullish_divergence(prices, histogram, lookback=10):
-    if len(prices) < lookback + 1 or len(histogram) < lookback + 1:
+    """Price lower over the lookback while the MACD histogram has come back
+    up off a negative low. Takes NumPy arrays."""
+    if prices.size < lookback + 1 or histogram.size < lookback + 1:
         return False
-    recent_prices = prices.iloc[-lookback:]
-    recent_hist = histogram.iloc[-lookback:]
-    price_falling = recent_prices.iloc[-1] < recent_prices.iloc[0]
-    hist_min = recent_hist.min()
-    hist_now = recent_hist.iloc[-1]
-    histogram_narrowing = (hist_min < 0) and (hist_now > hist_min)
-    return price_falling and histogram_narrowing
+    p = prices[-lookback:]
+    h = histogram[-lookback:]
+    hist_min = h.min()
+    return bool(p[-1] < p[0] and hist_min < 0 and h[-1] > hist_min)
 
 
-def volume_declining_on_down_days(df, lookback=10):
-    if len(df) < lookback * 2:
+def volume_declining_on_down_days(close, open_, volume, lookback=10):
+    """Average volume on down days (close < open) is lower over the last
+    `lookback` days than over the `lookback` days before. Takes NumPy arrays."""
+    if close.size < lookback * 2:
         return False
-    recent = df.iloc[-lookback:]
-    prior = df.iloc[-lookback * 2: -lookback]
-    recent_down = recent[recent["Close"] < recent["Open"]]
-    prior_down = prior[prior["Close"] < prior["Open"]]
-    if len(recent_down) == 0 or len(prior_down) == 0:
+    down = close[-lookback * 2:] < open_[-lookback * 2:]
+    vol = volume[-lookback * 2:]
+    prior_down, recent_down = down[:lookback], down[lookback:]
+    if not recent_down.any() or not prior_down.any():
         return False
-    return recent_down["Volume"].mean() < prior_down["Volume"].mean()
+    return bool(vol[lookback:][recent_down].mean() < vol[:lookback][prior_down].mean())
 
 
 # ---------------------------------------------------------------------------
@@ -107,16 +170,40 @@ def volume_declining_on_down_days(df, lookback=10):
 SP500_FWD_PE = 21.5
 
 
-def format_score_bar(score, max_score=7):
-    filled = score
-    empty = max_score - score
-    if score >= 5:
-        colour = GREEN
-    elif score >= 3:
-        colour = YELLOW
-    else:
-        colour = RED
-    return f"{colour}{'█' * filled}{DIM}{'░' * empty}{RESET} {colour}{score}/{max_score}{RESET}"
+def cat(*parts):
+    """Element-wise string concatenation of arrays and scalars."""
+    out = np.asarray(parts[0], dtype=str)
+    for part in parts[1:]:
+        out = np.char.add(out, part)
+    return out
+
+
+def optional(x):
+    return None if np.isnan(x) else float(x)
+
+
+# The column formatters below colour a whole table column in one pass over
+# the result arrays instead of building ANSI f-strings cell by cell.
+
+def score_bar_column(scores, max_score=7):
+    colour = np.select([scores >= 5, scores >= 3], [GREEN, YELLOW], RED)
+    return cat(colour, np.char.multiply("█", scores), DIM, np.char.multiply("░", max_score - scores),
+               RESET, " ", colour, np.char.mod("%d", scores), f"/{max_score}", RESET)
+
+
+def price_column(prices):
+    missing = np.isnan(prices) | (prices == 0)
+    return np.where(missing, dim("N/A"), np.char.mod("$%.2f", prices))
+
+
+def pct_column(values):
+    colour = np.where(values >= 0, GREEN, RED)
+    return np.where(np.isnan(values), dim("N/A"), cat(colour, np.char.mod("%+.1f%%", values), RESET))
+
+
+def pe_column(pe):
+    colour = np.select([pe < SP500_FWD_PE, pe < SP500_FWD_PE * 1.5], [GREEN, YELLOW], RED)
+    return np.where(np.isnan(pe), dim("N/A"), cat(colour, np.char.mod("%.1fx", pe), RESET))
 
 
 def format_rsi(rsi, flag):
@@ -134,20 +221,12 @@ def format_rsi(rsi, flag):
         return f"{rsi:.1f}"
 
 
-def format_pe(pe):
-    if pe is None:
-        return dim("N/A")
-    colour = GREEN if pe < SP500_FWD_PE else (YELLOW if pe < SP500_FWD_PE * 1.5 else RED)
-    return f"{colour}{pe:.1f}x{RESET}"
-
-
-def format_analyst(rating, pct_upside):
+def format_analyst(rating, pct_upside, buy_rated):
     if rating is None and pct_upside is None:
         return dim("N/A")
     parts = []
     if rating:
-        buy_ratings = {"buy", "strong_buy", "strongbuy", "outperform", "overweight"}
-        colour = GREEN if rating.lower().replace(" ", "_") in buy_ratings else YELLOW
+        colour = GREEN if buy_rated else YELLOW
         parts.append(f"{colour}{rating.upper()}{RESET}")
     if pct_upside is not None:
         parts.append(colour_pct(pct_upside))
@@ -165,6 +244,72 @@ def format_vol_ratio(ratio):
         return f"{ratio:.2f}x"
 
 
+# ---------------------------------------------------------------------------
+# Data fetching
+# ---------------------------------------------------------------------------
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "screener")
+PRICE_TTL = 24 * 60 * 60       # seconds
+INFO_TTL = 7 * 24 * 60 * 60    # fundamentals change slowly
+
+
+def cached(name, ttl, fetch, use_cache=True, complete=len):
+    """Return fetch(), reusing a pickle under CACHE_DIR while it is younger
+    than ttl seconds. Results are only written when complete(value) is true
+    (by default: non-empty)."""
+    path = os.path.join(CACHE_DIR, name + ".pkl")
+    if use_cache and os.path.exists(path) and time.time() - os.path.getmtime(path) < ttl:
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass  # unreadable entry: refetch and overwrite it
+
+    value = fetch()
+    if use_cache and complete(value):
+        # Write to a temp file and rename, so an interrupted run never leaves
+        # a truncated entry behind
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+    return value
+
+
+def fetch_info(handle, use_cache=True):
+    """`.info` for a yf.Ticker handle, or {} if the lookup fails."""
+    def fetch():
+        try:
+            return handle.info or {}
+        except Exception:
+            return {}
+    return cached(f"info_{handle.ticker}", INFO_TTL, fetch, use_cache)
+
+
+def fetch_prices(tickers, use_cache=True):
+    key = hashlib.md5(",".join(sorted(tickers)).encode()).hexdigest()
+    return cached(f"prices_{key}", PRICE_TTL,
+                  lambda: yf.download(tickers, period="1y", group_by="ticker",
+                                      progress=False, threads=True),
+                  use_cache, lambda raw: has_all_closes(raw, tickers))
+
+
+def has_all_closes(raw, tickers):
+    """True if every ticker has at least one valid Close; a failed symbol
+    comes back as an all-NaN column and must not be cached."""
+    try:
+        closes = raw.xs("Close", axis=1, level=1)
+    except (KeyError, TypeError):
+        return False
+    return (all(t in closes.columns for t in tickers)
+            and bool(closes[list(tickers)].notna().any().all()))
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -172,12 +317,22 @@ def format_vol_ratio(ratio):
 DEFAULT_TICKERS = ["ANET", "INOD", "MOD", "PATH", "DOCU", "INTU", "TEAM",
                    "NBIS", "SMCI", "CRDO", "VRT"]
 
-BUY_RATINGS = {"buy", "strong_buy", "strongbuy", "outperform", "overweight"}
+BUY_RATINGS = frozenset({"buy", "strong_buy", "strongbuy", "outperform", "overweight"})
+
+# Per-ticker results are held as one array per field (NaN / False = missing)
+NUMERIC_FIELDS = ("price", "pct_off_high", "rsi", "pct_vs_ma200", "fwd_pe",
+                  "fwd_eps", "vol_ratio", "pct_upside")
+FLAG_FIELDS = ("macd_divergence", "vol_declining_down", "buy_rated", "failed")
+SIGNAL_LABELS = ("RSI<30", "PE<15", "<200MA", "MACD Div", "Buy rated",
+                 "Fwd EPS+", "Vol exhaust")
 
 
 def main():
-    tickers = sys.argv[1:] if len(sys.argv) > 1 else DEFAULT_TICKERS
-    tickers = [t.upper() for t in tickers]
+    args = sys.argv[1:]
+    use_cache = "--no-cache" not in args
+    tickers = [a for a in args if a != "--no-cache"] or DEFAULT_TICKERS
+    # yfinance drops repeated symbols from the batch, so dedupe up front
+    tickers = list(dict.fromkeys(t.upper() for t in tickers))
 
     print()
     print(f"{BOLD}{CYAN}{'=' * 72}{RESET}")
@@ -191,132 +346,152 @@ def main():
 
     # --- Batch download all price data in one call ---
     print(f"  Fetching price data (batch)...", end="", flush=True)
-    raw = yf.download(tickers, period="1y", group_by="ticker", progress=False, threads=True)
+    raw = fetch_prices(tickers, use_cache)
     print(f" done.")
 
     # yfinance with group_by='ticker' always returns multi-level columns
     single_ticker = False
 
-    # --- Fetch fundamental data per ticker ---
+    # Split the MultiIndex frame once; dict lookups in the loop are cheap
+    per_ticker = {t: raw[t] for t in raw.columns.unique(level=0)}
+
+    # --- Indicators for every ticker at once on the (dates x tickers) closes ---
+    try:
+        closes = raw.xs("Close", axis=1, level=1)
+    except (KeyError, TypeError):
+        # Flat or empty download: every ticker falls through to an N/A row
+        closes = pd.DataFrame(index=raw.index)
+    closes = closes.reindex(columns=tickers)
+    rsi_df = compute_rsi(closes)
+    _, _, hist_df = compute_macd(closes)
+
+    # --- Fetch fundamental data concurrently (I/O bound) ---
     infos = {}
-    for i, ticker in enumerate(tickers):
-        sys.stdout.write(f"\r  Fetching fundamentals... [{i+1}/{len(tickers)}] {ticker:<6}")
-        sys.stdout.flush()
-        try:
-            infos[ticker] = yf.Ticker(ticker).info or {}
-        except Exception:
-            infos[ticker] = {}
-        time.sleep(0.2)  # gentle rate limiting
+    with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as pool:
+        # One Tickers wrapper so every lookup shares yfinance's session
+        handles = yf.Tickers(" ".join(tickers)).tickers
+        futures = {pool.submit(fetch_info, handles[t], use_cache): t for t in tickers}
+        for i, fut in enumerate(as_completed(futures)):
+            ticker = futures[fut]
+            infos[ticker] = fut.result()
+            sys.stdout.write(f"\r  Fetching fundamentals... [{i+1}/{len(tickers)}] {ticker:<6}")
+            sys.stdout.flush()
     sys.stdout.write("\r" + " " * 60 + "\r")
     sys.stdout.flush()
 
-    # --- Analyse each ticker ---
-    results = []
-    for ticker in tickers:
-        r = {
-            "ticker": ticker, "price": None, "pct_off_high": None,
-            "rsi": None, "rsi_flag": "", "macd_divergence": False,
-            "pct_vs_ma200": None, "fwd_pe": None,
-            "vol_ratio": None, "vol_declining_down": False,
-            "analyst_rating": None, "pct_upside": None,
-            "fwd_earnings_positive": None,
-            "score": 0, "score_details": [],
-        }
+    # --- Analyse each ticker into parallel per-field arrays ---
+    n = len(tickers)
+    num = {f: np.full(n, np.nan) for f in NUMERIC_FIELDS}
+    flag = {f: np.zeros(n, dtype=bool) for f in FLAG_FIELDS}
+    rsi_flags = [""] * n
+    ratings = [None] * n
 
+    for i, ticker in enumerate(tickers):
         try:
             # Extract this ticker's data from the batch download
-            if single_ticker:
-                df = raw.copy()
-            else:
-                df = raw[ticker].copy()
-
+            # dropna already returns a new frame, so no defensive copy is needed
+            df = raw if single_ticker else per_ticker[ticker]
             df = df.dropna(subset=["Close"])
             if len(df) < 30:
-                results.append(r)
                 continue
 
+            # Raw arrays; scalars and tail windows below index these directly
             close = df["Close"]
-            current_price = float(close.iloc[-1])
-            high_52w = float(close.max())
-            r["price"] = current_price
-            r["pct_off_high"] = ((current_price - high_52w) / high_52w) * 100
+            close_arr = close.to_numpy()
+            open_arr = df["Open"].to_numpy()
+            vol_arr = df["Volume"].to_numpy()
+
+            current_price = float(close_arr[-1])
+            high_52w = float(close_arr.max())
+            num["price"][i] = current_price
+            num["pct_off_high"][i] = ((current_price - high_52w) / high_52w) * 100
 
             # RSI
-            rsi_series = compute_rsi(close)
-            rsi_val = float(rsi_series.iloc[-1])
-            r["rsi"] = rsi_val
+            rsi_val = float(rsi_df[ticker].loc[close.index[-1]])
+            num["rsi"][i] = rsi_val
             if rsi_val < 20:
-                r["rsi_flag"] = "EXTREMELY OVERSOLD"
+                rsi_flags[i] = "EXTREMELY OVERSOLD"
             elif rsi_val < 30:
-                r["rsi_flag"] = "OVERSOLD"
+                rsi_flags[i] = "OVERSOLD"
 
             # MACD
-            _, _, histogram = compute_macd(close)
-            r["macd_divergence"] = detect_bullish_divergence(close, histogram)
+            histogram = hist_df[ticker].loc[close.index]
+            flag["macd_divergence"][i] = detect_bullish_divergence(close_arr, histogram.to_numpy())
 
-            # 200-day MA
-            if len(close) >= 200:
-                ma200 = float(close.rolling(200).mean().iloc[-1])
-            else:
-                ma200 = float(close.mean())
-            r["pct_vs_ma200"] = ((current_price - ma200) / ma200) * 100
+            # 200-day MA (only the latest value is needed, so average the
+            # trailing window instead of building a full rolling series)
+            ma200 = float(close_arr[-200:].mean())
+            num["pct_vs_ma200"][i] = ((current_price - ma200) / ma200) * 100
 
             # Volume
-            vol = df["Volume"]
-            vol_5d = float(vol.iloc[-5:].mean())
-            vol_30d = float(vol.iloc[-30:].mean())
+            vol_5d = np.nanmean(vol_arr[-5:])
+            vol_30d = np.nanmean(vol_arr[-30:])
             if vol_30d > 0:
-                r["vol_ratio"] = vol_5d / vol_30d
-            r["vol_declining_down"] = volume_declining_on_down_days(df)
+                num["vol_ratio"][i] = vol_5d / vol_30d
+            flag["vol_declining_down"][i] = volume_declining_on_down_days(close_arr, open_arr, vol_arr)
 
             # Fundamentals from info
             info = infos.get(ticker, {})
             fwd_pe = info.get("forwardPE")
             if fwd_pe and fwd_pe > 0:
-                r["fwd_pe"] = fwd_pe
+                num["fwd_pe"][i] = fwd_pe
             elif info.get("forwardEps") and info["forwardEps"] > 0:
-                r["fwd_pe"] = current_price / info["forwardEps"]
+                num["fwd_pe"][i] = current_price / info["forwardEps"]
 
             fwd_eps = info.get("forwardEps")
             if fwd_eps is not None:
-                r["fwd_earnings_positive"] = fwd_eps > 0
+                num["fwd_eps"][i] = fwd_eps
 
             target = info.get("targetMeanPrice")
             if target and target > 0:
-                r["pct_upside"] = ((target - current_price) / current_price) * 100
+                num["pct_upside"][i] = ((target - current_price) / current_price) * 100
 
+            # Normalise the rating once; scoring and display reuse the flag
             rec = info.get("recommendationKey", "")
-            r["analyst_rating"] = rec if rec else None
-
-            # --- Oversold Score (0-7) ---
-            score = 0
-            details = []
-
-            if r["rsi"] is not None and r["rsi"] < 30:
-                score += 1; details.append("RSI<30")
-            if r["fwd_pe"] is not None and 0 < r["fwd_pe"] < 15:
-                score += 1; details.append("PE<15")
-            if r["pct_vs_ma200"] is not None and r["pct_vs_ma200"] < 0:
-                score += 1; details.append("<200MA")
-            if r["macd_divergence"]:
-                score += 1; details.append("MACD Div")
-            if r["analyst_rating"] and r["analyst_rating"].lower().replace(" ", "_") in BUY_RATINGS:
-                score += 1; details.append("Buy rated")
-            if r["fwd_earnings_positive"]:
-                score += 1; details.append("Fwd EPS+")
-            if r["vol_declining_down"]:
-                score += 1; details.append("Vol exhaust")
-
-            r["score"] = score
-            r["score_details"] = details
+            ratings[i] = rec if rec else None
+            flag["buy_rated"][i] = bool(rec) and rec.lower().replace(" ", "_") in BUY_RATINGS
 
         except Exception as e:
-            r["rsi_flag"] = f"Error: {e}"
-
+            rsi_flags[i] = f"Error: {e}"
+            flag["failed"][i] = True
+
+    # --- Oversold Score (0-7): one boolean column per signal ---
+    signals = np.column_stack([
+        num["rsi"] < 30,
+        (num["fwd_pe"] > 0) & (num["fwd_pe"] < 15),
+        num["pct_vs_ma200"] < 0,
+        flag["macd_divergence"],
+        flag["buy_rated"],
+        num["fwd_eps"] > 0,
+        flag["vol_declining_down"],
+    ]) & ~flag["failed"][:, None]
+    scores = signals.sum(axis=1)
+
+    # Sort by score desc, then RSI asc (lexsort keys are minor-first)
+    order = np.lexsort((np.nan_to_num(num["rsi"], nan=999), -scores))
+
+    # Materialise row dicts only for the report below
+    results = []
+    for i in order:
+        fwd_eps = num["fwd_eps"][i]
+        r = {f: optional(num[f][i]) for f in NUMERIC_FIELDS if f != "fwd_eps"}
+        r.update({
+            "ticker": tickers[i], "rsi_flag": rsi_flags[i],
+            "macd_divergence": bool(flag["macd_divergence"][i]),
+            "vol_declining_down": bool(flag["vol_declining_down"][i]),
+            "analyst_rating": ratings[i], "buy_rated": bool(flag["buy_rated"][i]),
+            "fwd_earnings_positive": None if np.isnan(fwd_eps) else bool(fwd_eps > 0),
+            "score": int(scores[i]),
+            "score_details": [SIGNAL_LABELS[j] for j in np.flatnonzero(signals[i])],
+        })
         results.append(r)
 
-    # Sort by score desc, then RSI asc
-    results.sort(key=lambda x: (-x["score"], x["rsi"] if x["rsi"] is not None else 999))
+    # Shared numeric columns, formatted once per column in ranking order
+    price_col = price_column(num["price"][order]).tolist()
+    off_high_col = pct_column(num["pct_off_high"][order]).tolist()
+    ma200_col = pct_column(num["pct_vs_ma200"][order]).tolist()
+    pe_col = pe_column(num["fwd_pe"][order]).tolist()
+    bar_col = score_bar_column(scores[order]).tolist()
 
     # -----------------------------------------------------------------------
     # Table 1: Price & Technical Overview
@@ -324,14 +499,14 @@ def main():
     print(f"{BOLD}{MAGENTA}--- PRICE & TECHNICAL OVERVIEW ---{RESET}")
     print()
     rows_tech = []
-    for r in results:
+    for k, r in enumerate(results):
         rows_tech.append([
             f"{BOLD}{r['ticker']}{RESET}",
-            f"${r['price']:.2f}" if r["price"] else dim("N/A"),
-            colour_pct(r["pct_off_high"]) if r["pct_off_high"] is not None else dim("N/A"),
+            price_col[k],
+            off_high_col[k],
             format_rsi(r["rsi"], r["rsi_flag"]),
             green("YES") if r["macd_divergence"] else dim("no"),
-            colour_pct(r["pct_vs_ma200"]) if r["pct_vs_ma200"] is not None else dim("N/A"),
+            ma200_col[k],
         ])
     print(tabulate(rows_tech,
                    headers=["Ticker", "Price", "% Off High", "RSI (14d)", "MACD Div", "vs 200MA"],
@@ -344,15 +519,15 @@ def main():
     print(f"{BOLD}{MAGENTA}--- FUNDAMENTAL & VOLUME ANALYSIS ---{RESET}")
     print()
     rows_fund = []
-    for r in results:
+    for k, r in enumerate(results):
         rows_fund.append([
             f"{BOLD}{r['ticker']}{RESET}",
-            format_pe(r["fwd_pe"]),
+            pe_col[k],
             green("YES") if r["fwd_earnings_positive"] else (
                 red("NO") if r["fwd_earnings_positive"] is False else dim("N/A")),
             format_vol_ratio(r["vol_ratio"]),
             green("YES") if r["vol_declining_down"] else dim("no"),
-            format_analyst(r["analyst_rating"], r["pct_upside"]),
+            format_analyst(r["analyst_rating"], r["pct_upside"], r["buy_rated"]),
         ])
     print(tabulate(rows_fund,
                    headers=["Ticker", "Fwd P/E", "Fwd EPS+", "Vol 5d/30d", "Vol Exhaust", "Analyst"],
@@ -365,14 +540,14 @@ def main():
     print(f"{BOLD}{MAGENTA}--- OVERSOLD SCORE RANKING ---{RESET}")
     print()
     rows_score = []
-    for r in results:
+    for k, r in enumerate(results):
         details_str = ", ".join(r["score_details"]) if r["score_details"] else dim("none")
         rows_score.append([
             f"{BOLD}{r['ticker']}{RESET}",
-            format_score_bar(r["score"]),
+            bar_col[k],
             details_str,
-            f"${r['price']:.2f}" if r["price"] else dim("N/A"),
-            colour_pct(r["pct_off_high"]) if r["pct_off_high"] is not None else dim("N/A"),
+            price_col[k],
+            off_high_col[k],
         ])
     print(tabulate(rows_score,
                    headers=["Ticker", "Score", "Signals Triggered", "Price", "% Off High"],